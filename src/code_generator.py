@@ -1,10 +1,71 @@
 #!/usr/bin/env python3
 
 import os
+import re
 from rich.console import Console
 
 console = Console()
 
+# Fenced code block in an LLM response
+_CODE_BLOCK_RE = re.compile(r'```(?:\w+)?\n(.*?)```', re.DOTALL)
+
+# Map language name to file extension
+_LANG_TO_EXT = {
+    'python': 'py',
+    'javascript': 'js',
+    'typescript': 'ts',
+    'html': 'html',
+    'css': 'css',
+    'c': 'c',
+    'cpp': 'cpp',
+    'c++': 'cpp',
+    'java': 'java',
+    'go': 'go',
+    'rust': 'rs',
+}
+
+# System prompt used for all code generation requests. Instructions shared by every
+# task live here rather than in the task prompts, so they form one reusable prefix.
+_SYSTEM_PROMPT = """
+You are an expert programmer. You generate high-quality, functional code based on requirements.
+Make sure the code is:
+- Well-documented with minimal comments
+- Follows best practices for the language
+- Complete and ready to use without additional changes
+- Written in a clean, maintainable style
+Only provide the requested code without explanations.
+"""
+
+# Task prompts, filled in with the per-request details
+_FUNCTION_PROMPT = """
+Generate a function in {language} that does the following:
+{description}
+"""
+
+_COMPLETE_PROMPT = """
+Complete the following {language} code:
+
+```{language}
+{code}
+```
+"""
+
+_FIX_PROMPT = """
+Fix the following {language} code that is producing this error:
+
+Error: {error}
+
+Code:
+```{language}
+{code}
+```
+"""
+
+_FILE_PROMPT = """
+Generate a complete {language} file named '{filename}' that:
+{description}
+"""
+
 class CodeGenerator:
     """
     Handles code generation using the LLM
@@ -17,32 +78,10 @@ class CodeGenerator:
         """
         Generate code based on prompt and optional context
         """
-        # Add a system prompt for code generation
-        system_prompt = """
-You are an expert programmer. You generate high-quality, functional code based on requirements.
-Make sure the code is:
-- Well-documented with minimal comments
-- Follows best practices for the language
-- Complete and ready to use without additional changes
-- Written in a clean, maintainable style
-"""
-        
-        formatted_prompt = prompt
-        
-        # Add context if provided
-        if context:
-            formatted_prompt = f"""
-Context:
-{context}
-
-Generate the following code:
-{prompt}
-"""
-        
         # Call the LLM
         response = self.llm_manager.query(
-            formatted_prompt,
-            system_prompt=system_prompt,
+            self._format_prompt(prompt, context),
+            system_prompt=_SYSTEM_PROMPT,
             temperature=0.2  # Lower temperature for more deterministic code generation
         )
         
@@ -50,49 +89,36 @@ Generate the following code:
         code = self._extract_code(response)
         return code
     
+    def generate_many(self, prompts, context=None):
+        """
+        Generate code for several independent prompts concurrently
+        """
+        responses = self.llm_manager.query_many(
+            [self._format_prompt(prompt, context) for prompt in prompts],
+            system_prompt=_SYSTEM_PROMPT,
+            temperature=0.2
+        )
+        return [self._extract_code(response) for response in responses]
+    
     def generate_function(self, function_description, language, context=None):
         """
         Generate a specific function based on description
         """
-        prompt = f"""
-Generate a function in {language} that does the following:
-{function_description}
-
-Only give me the function code without explanations.
-"""
+        prompt = _FUNCTION_PROMPT.format(language=language, description=function_description)
         return self.generate(prompt, context=context)
     
     def complete_code(self, partial_code, language):
         """
         Complete partial code
         """
-        prompt = f"""
-Complete the following {language} code:
-
-```{language}
-{partial_code}
-```
-
-Only provide the completed code without explanations.
-"""
+        prompt = _COMPLETE_PROMPT.format(language=language, code=partial_code)
         return self.generate(prompt)
     
     def fix_code(self, broken_code, error_message, language):
         """
         Fix broken code based on error message
         """
-        prompt = f"""
-Fix the following {language} code that is producing this error:
-
-Error: {error_message}
-
-Code:
-```{language}
-{broken_code}
-```
-
-Only provide the fixed code without explanations.
-"""
+        prompt = _FIX_PROMPT.format(language=language, error=error_message, code=broken_code)
         return self.generate(prompt)
     
     def generate_file(self, file_description, filename, language, project_path=None):
@@ -101,29 +127,10 @@ Only provide the fixed code without explanations.
         """
         ext = os.path.splitext(filename)[1].lstrip('.')
         if not ext and language:
-            # Map language name to extension
-            ext_map = {
-                'python': 'py',
-                'javascript': 'js',
-                'typescript': 'ts',
-                'html': 'html',
-                'css': 'css',
-                'c': 'c',
-                'cpp': 'cpp',
-                'c++': 'cpp',
-                'java': 'java',
-                'go': 'go',
-                'rust': 'rs',
-            }
-            ext = ext_map.get(language.lower(), '')
+            ext = _LANG_TO_EXT.get(language.lower(), '')
             filename = f"{filename}.{ext}"
         
-        prompt = f"""
-Generate a complete {language} file named '{filename}' that:
-{file_description}
-
-Only provide the code for the file without explanations.
-"""
+        prompt = _FILE_PROMPT.format(language=language, filename=filename, description=file_description)
         code = self.generate(prompt)
         
         if project_path:
@@ -141,18 +148,25 @@ Only provide the code for the file without explanations.
         
         return code
     
+    def _format_prompt(self, prompt, context=None):
+        """
+        Add context to a prompt if provided
+        """
+        if not context:
+            return prompt
+        
+        return f"""
+Context:
+{context}
+
+Generate the following code:
+{prompt}
+"""
+    
     def _extract_code(self, response):
         """
         Extract code blocks from text response
         """
-        import re
-        
-        # Look for code blocks with triple backticks
-        code_blocks = re.findall(r'```(?:\w+)?\n(.*?)```', response, re.DOTALL)
-        
-        if code_blocks:
-            # Return the first code block found
-            return code_blocks[0].strip()
-        
-        # If no code blocks, return the entire response
-        return response.strip() 
\ No newline at end of file
+        # Return the first code block found, or the entire response if there is none
+        match = _CODE_BLOCK_RE.search(response)
+        return match.group(1).strip() if match else response.strip() 
\ No newline at end of file
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+
+import os
+import json
+import time
+import hashlib
+from collections import OrderedDict
+from rich.console import Console
+
+console = Console()
+
+def cache_key(model, prompt, system, temperature):
+    """
+    Build a content-addressed key for an LLM request
+    """
+    data = json.dumps({
+        'model': model,
+        'prompt': prompt,
+        'system': system,
+        'temperature': temperature,
+    }, sort_keys=True)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+class MemoryBackend:
+    """
+    Keeps cached responses in memory, evicting the least recently used
+    """
+    
+    def __init__(self, max_entries=1000):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+    
+    def __len__(self):
+        return len(self.entries)
+    
+    def get(self, key):
+        """Return the (timestamp, response) entry for a key, or None"""
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+    
+    def set(self, key, entry):
+        """Store a (timestamp, response) entry"""
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+
+class FileBackend:
+    """
+    Keeps cached responses on disk, one JSON file per key
+    """
+    
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+    
+    def __len__(self):
+        return sum(1 for name in os.listdir(self.directory) if name.endswith('.json'))
+    
+    def get(self, key):
+        """Return the (timestamp, response) entry for a key, or None"""
+        try:
+            with open(os.path.join(self.directory, f"{key}.json"), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            return data['created'], data['response']
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            console.print(f"[bold red]Error reading cache entry: {str(e)}[/bold red]")
+            return None
+    
+    def set(self, key, entry):
+        """Store a (timestamp, response) entry"""
+        created, response = entry
+        try:
+            with open(os.path.join(self.directory, f"{key}.json"), 'w', encoding='utf-8') as f:
+                json.dump({'created': created, 'response': response}, f)
+        except Exception as e:
+            console.print(f"[bold red]Error writing cache entry: {str(e)}[/bold red]")
+
+class LLMCache:
+    """
+    Caches LLM responses by request key, with optional expiry
+    """
+    
+    def __init__(self, backend, ttl=None):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, key):
+        """Return the cached response for a key, or None"""
+        entry = self.backend.get(key)
+        if entry is None or (self.ttl and time.time() - entry[0] > self.ttl):
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return entry[1]
+    
+    def set(self, key, response):
+        """Store a response for a key"""
+        self.backend.set(key, (time.time(), response))
+    
+    def stats(self):
+        """Return hit/miss counters and the number of stored entries"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self.backend),
+        }
+
+class SemanticCache:
+    """
+    Caches LLM responses by prompt embedding, matching near-duplicate prompts.
+    Requires numpy, which is only imported when a semantic cache is created.
+    """
+    
+    def __init__(self, threshold=0.93, max_entries=1000):
+        import numpy
+        self._np = numpy
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.indexes = {}  # scope -> (embedding matrix, responses)
+        self.hits = 0
+        self.misses = 0
+    
+    def get(self, scope, embedding):
+        """Return the response stored for the most similar prompt in a scope, or None"""
+        index = self.indexes.get(scope)
+        if index is not None:
+            embeddings, responses = index
+            sims = embeddings @ self._normalize(embedding)
+            best = int(sims.argmax())
+            if sims[best] > self.threshold:
+                self.hits += 1
+                return responses[best]
+        
+        self.misses += 1
+        return None
+    
+    def set(self, scope, embedding, response):
+        """Store a response under a prompt embedding in a scope"""
+        np = self._np
+        vector = self._normalize(embedding)[np.newaxis, :]
+        if scope in self.indexes:
+            embeddings, responses = self.indexes[scope]
+            embeddings = np.vstack([embeddings, vector])[-self.max_entries:]
+            responses = (responses + [response])[-self.max_entries:]
+        else:
+            embeddings, responses = vector, [response]
+        self.indexes[scope] = (embeddings, responses)
+    
+    def stats(self):
+        """Return hit/miss counters and the number of stored entries"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': sum(len(responses) for _, responses in self.indexes.values()),
+        }
+    
+    def _normalize(self, embedding):
+        """L2-normalize an embedding so a dot product gives cosine similarity"""
+        np = self._np
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
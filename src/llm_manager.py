@@ -2,10 +2,25 @@
 
 import os
 import json
-import subprocess
-import tempfile
+import asyncio
+import httpx
 from rich.console import Console
 
+# orjson is a faster drop-in for encoding requests and decoding streamed chunks, if installed
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj).encode('utf-8')
+    _loads = json.loads
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+from src.llm_cache import LLMCache, SemanticCache, MemoryBackend, FileBackend, cache_key
+from src.program_cache import ProgramCache
+
 console = Console()
 
 class LLMManager:
@@ -16,8 +31,62 @@ class LLMManager:
     def __init__(self, config):
         self.config = config
         self.models = {model['name']: model for model in config['models']['available']}
+        # (system prompt, temperature, max tokens) per model, resolved once with defaults
+        self._model_params = {
+            name: (model.get('system_prompt', ''), model.get('temperature', 0.7), model.get('max_tokens', 4000))
+            for name, model in self.models.items()
+        }
         self.current_model = config['models']['default']
-        self.verify_models()
+        
+        # Long-lived HTTP client so the connection to Ollama is kept alive between queries
+        ollama_config = config.get('ollama', {})
+        self._client_options = {
+            'base_url': ollama_config.get('host', 'http://localhost:11434'),
+            'timeout': httpx.Timeout(ollama_config.get('timeout', 300.0), connect=10.0),
+            'limits': httpx.Limits(max_keepalive_connections=40, max_connections=100, keepalive_expiry=30.0),
+        }
+        self._client = httpx.Client(**self._client_options)
+        
+        # Requests beyond the server's parallel slots would wait in Ollama's queue while their
+        # read timeout runs, so query_many only sends this many at once
+        self.max_parallel_requests = max(1, int(
+            ollama_config.get('max_parallel_requests') or os.environ.get('OLLAMA_NUM_PARALLEL') or 1
+        ))
+        
+        # Cache responses to repeated low-temperature prompts
+        cache_config = config.get('cache', {})
+        self.cache = None
+        self.cache_max_temperature = cache_config.get('max_temperature', 0.2)
+        if cache_config.get('enabled', True):
+            if cache_config.get('backend', 'memory') == 'file':
+                backend = FileBackend(os.path.expanduser(cache_config.get('directory', '~/.offline_assistant_cache')))
+            else:
+                backend = MemoryBackend(cache_config.get('max_entries', 1000))
+            self.cache = LLMCache(backend, ttl=cache_config.get('ttl'))
+        
+        # Optionally match paraphrased prompts by embedding similarity
+        semantic_config = cache_config.get('semantic', {})
+        self.semantic_cache = None
+        self.embedding_model = semantic_config.get('model', 'mxbai-embed-large')
+        # Paraphrases are matched at higher temperatures than exact repeats, so this has its own limit
+        self.semantic_max_temperature = semantic_config.get('max_temperature', 1.0)
+        if semantic_config.get('enabled', False):
+            try:
+                self.semantic_cache = SemanticCache(
+                    threshold=semantic_config.get('threshold', 0.93),
+                    max_entries=cache_config.get('max_entries', 1000)
+                )
+            except ImportError:
+                console.print("[bold yellow]Warning: the semantic cache requires numpy (pip install numpy); it is disabled[/bold yellow]")
+        
+        # Answer well-known prompt patterns without calling the LLM
+        program_config = config.get('program_cache', {})
+        self.program_cache = None
+        if program_config.get('enabled', True):
+            self.program_cache = ProgramCache(program_config.get('patterns', []), context_names=('model', 'models'))
+        
+        if ollama_config.get('verify_models', True):
+            self.verify_models()
     
     @property
     def model_name(self):
@@ -27,18 +96,11 @@ class LLMManager:
     def verify_models(self):
         """Verify that required models are available in Ollama"""
         try:
-            result = subprocess.run(
-                ["ollama", "list"], 
-                capture_output=True, 
-                text=True, 
-                check=True
-            )
+            response = self._client.get("/api/tags")
+            response.raise_for_status()
             
-            available_models = set()
-            for line in result.stdout.splitlines()[1:]:  # Skip header line
-                if line.strip():
-                    model_name = line.split()[0].split(':')[0]  # Extract base model name
-                    available_models.add(model_name)
+            # Extract base model names (without the tag)
+            available_models = {model['name'].split(':')[0] for model in _loads(response.content)['models']}
             
             missing_models = []
             for model_name in self.models:
@@ -59,37 +121,183 @@ class LLMManager:
             return True
         return False
     
+    def _build_payload(self, prompt, system_prompt, temperature, stream):
+        """Build the /api/generate request body for the current model"""
+        default_system, default_temp, max_tokens = self._model_params[self.current_model]
+        system = system_prompt or default_system
+        temp = temperature if temperature is not None else default_temp
+        
+        return {
+            "model": self.current_model,
+            "prompt": prompt,
+            "system": system,
+            "options": {"temperature": temp, "num_predict": max_tokens},
+            "stream": stream,
+        }
+    
+    def _embed(self, text):
+        """Return the embedding of a text, or None if it could not be computed"""
+        try:
+            response = self._client.post(
+                "/api/embeddings",
+                headers=_JSON_HEADERS,
+                content=_dumps({"model": self.embedding_model, "prompt": text})
+            )
+            response.raise_for_status()
+            return _loads(response.content)['embedding']
+        except Exception as e:
+            console.print(f"[bold red]Error computing embedding, disabling semantic cache: {str(e)}[/bold red]")
+            self.semantic_cache = None
+            return None
+    
+    def _cache_lookup(self, payload, semantic=True):
+        """
+        Look up a request in the response caches.
+        Returns the lookup state to pass to _cache_store and the cached response, if any.
+        """
+        if self.program_cache is not None:
+            cached = self.program_cache.try_match(
+                payload['prompt'],
+                model=self.current_model,
+                models=', '.join(self.models)
+            )
+            if cached is not None:
+                return None, cached
+        
+        temperature = payload['options']['temperature']
+        
+        key = None
+        if self.cache is not None and temperature <= self.cache_max_temperature:
+            key = cache_key(payload['model'], payload['prompt'], payload['system'], temperature)
+            if (cached := self.cache.get(key)) is not None:
+                return None, cached
+        
+        scope = embedding = None
+        if semantic and self.semantic_cache is not None and temperature <= self.semantic_max_temperature:
+            # Only match prompts sent with the same model, system prompt and temperature
+            scope = cache_key(payload['model'], '', payload['system'], temperature)
+            embedding = self._embed(payload['prompt'])
+            if embedding is not None and (cached := self.semantic_cache.get(scope, embedding)) is not None:
+                if key:
+                    self.cache.set(key, cached)
+                return None, cached
+        
+        if key is None and embedding is None:
+            return None, None
+        return (key, scope, embedding), None
+    
+    def _cache_store(self, lookup, response):
+        """Store a response in the caches checked by _cache_lookup"""
+        if lookup is None:
+            return
+        key, scope, embedding = lookup
+        if key:
+            self.cache.set(key, response)
+        if embedding is not None and self.semantic_cache is not None:
+            self.semantic_cache.set(scope, embedding, response)
+    
     def query(self, prompt, system_prompt=None, temperature=None):
         """
-        Send a query to the LLM and get a response
+        Send a query to the LLM and get the full response
+        """
+        with console.status("[dim]Thinking...[/dim]"):
+            return ''.join(self.query_stream(prompt, system_prompt, temperature)).strip()
+    
+    def query_stream(self, prompt, system_prompt=None, temperature=None):
+        """
+        Send a query to the LLM and yield the response as it is generated
         """
-        model_config = self.models[self.current_model]
-        system = system_prompt or model_config.get('system_prompt', '')
-        temp = temperature or model_config.get('temperature', 0.7)
-        max_tokens = model_config.get('max_tokens', 4000)
+        payload = self._build_payload(prompt, system_prompt, temperature, stream=True)
+        lookup, cached = self._cache_lookup(payload)
+        if cached is not None:
+            yield cached
+            return
         
         try:
-            # Use the JSON API format which is more reliable
-            prompt_with_system = f"{system}\n\n{prompt}" if system else prompt
-            
-            console.print("[dim]Thinking...[/dim]")
-            # According to the latest Ollama documentation, we need to pass the prompt directly
-            result = subprocess.run(
-                ["ollama", "run", self.current_model, prompt_with_system],
-                capture_output=True,
-                text=True
-            )
+            with self._client.stream(
+                "POST", "/api/generate", headers=_JSON_HEADERS, content=_dumps(payload)
+            ) as response:
+                if response.status_code != 200:
+                    response.read()
+                    console.print(f"[bold red]Error querying LLM: {response.text}[/bold red]")
+                    yield "Sorry, there was an error with the LLM. Please try again."
+                    return
+                
+                # Ollama streams one JSON object per line
+                chunks = []
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    chunk = _loads(line)
+                    if chunk.get('error'):
+                        # A failure after the response started is reported inside the stream
+                        console.print(f"[bold red]Error querying LLM: {chunk['error']}[/bold red]")
+                        yield ("\n\n" if chunks else "") + "Sorry, there was an error with the LLM. Please try again."
+                        return
+                    if chunk.get('response'):
+                        chunks.append(chunk['response'])
+                        yield chunk['response']
+                    if chunk.get('done'):
+                        # Only cache responses that completed
+                        self._cache_store(lookup, ''.join(chunks).strip())
+                        return
+                
+                console.print("[bold red]Error querying LLM: the response stream ended before it was complete[/bold red]")
+                yield ("\n\n" if chunks else "") + "Sorry, there was an error with the LLM. Please try again."
+                        
+        except Exception as e:
+            console.print(f"[bold red]Error querying LLM: {str(e)}[/bold red]")
+            yield "Sorry, there was an error with the LLM. Please try again."
+    
+    async def aquery(self, prompt, system_prompt=None, temperature=None, client=None):
+        """
+        Send a query to the LLM without blocking the event loop
+        """
+        if client is None:
+            async with httpx.AsyncClient(**self._client_options) as client:
+                return await self.aquery(prompt, system_prompt, temperature, client)
+        
+        payload = self._build_payload(prompt, system_prompt, temperature, stream=False)
+        # Embedding requests would block the event loop, so only the exact cache is used here
+        lookup, cached = self._cache_lookup(payload, semantic=False)
+        if cached is not None:
+            return cached
+        
+        try:
+            response = await client.post("/api/generate", headers=_JSON_HEADERS, content=_dumps(payload))
             
-            if result.returncode != 0:
-                console.print(f"[bold red]Error querying LLM: {result.stderr}[/bold red]")
+            if response.status_code != 200:
+                console.print(f"[bold red]Error querying LLM: {response.text}[/bold red]")
                 return "Sorry, there was an error with the LLM. Please try again."
-                
-            return result.stdout.strip()
+            
+            text = _loads(response.content)['response'].strip()
+            self._cache_store(lookup, text)
+            return text
             
         except Exception as e:
             console.print(f"[bold red]Error querying LLM: {str(e)}[/bold red]")
             return "Sorry, there was an error with the LLM. Please try again."
     
+    def query_many(self, prompts, system_prompt=None, temperature=None):
+        """
+        Send independent queries concurrently and return the responses in order.
+        At most max_parallel_requests are in flight; Ollama only processes them in parallel
+        when started with OLLAMA_NUM_PARALLEL > 1.
+        """
+        async def _batch():
+            slots = asyncio.Semaphore(self.max_parallel_requests)
+            
+            async def _limited(prompt, client):
+                # The request, and so its timeout, only starts once a slot is free
+                async with slots:
+                    return await self.aquery(prompt, system_prompt, temperature, client)
+            
+            async with httpx.AsyncClient(**self._client_options) as client:
+                return await asyncio.gather(*[_limited(prompt, client) for prompt in prompts])
+        
+        with console.status(f"[dim]Thinking... ({len(prompts)} requests)[/dim]"):
+            return asyncio.run(_batch())
+    
     def generate_with_context(self, prompt, context):
         """
         Generate a response with additional context
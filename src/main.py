@@ -2,27 +2,69 @@
 
 import os
 import sys
-import yaml
+import fnmatch
+import json
 import typer
-import subprocess
+import shutil
+import functools
+from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from rich.console import Console
-from rich.syntax import Syntax
 from rich.panel import Panel
 from datetime import datetime
 
-from src.llm_manager import LLMManager
-from src.project_analyzer import ProjectAnalyzer
-from src.code_generator import CodeGenerator
+# Heavy modules (yaml, httpx, numpy, pygments) are imported on first use so the
+# banner shows up before they load
+_LAZY_IMPORTS = {
+    'LLMManager': 'src.llm_manager',
+    'ProjectAnalyzer': 'src.project_analyzer',
+    'CodeGenerator': 'src.code_generator',
+}
+
+def __getattr__(name):
+    """Load the component classes on first access (PEP 562)"""
+    if name in _LAZY_IMPORTS:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 app = typer.Typer()
 console = Console()
 
+# Locations inside the assistant's own directory
+_ROOT = Path(__file__).resolve().parent.parent
+_CONFIG_PATH = _ROOT / "config" / "config.yaml"
+_HISTORY_DIR = _ROOT / "history"
+
+# How much of a file is shown in the terminal and sent to the LLM by 'analyze'
+_MAX_DISPLAY_CHARS = 200_000
+_MAX_PROMPT_CHARS = 10000
+
+# 'analyze_all' asks for confirmation before sending more requests than this
+_BATCH_CONFIRM_REQUESTS = 5
+
+@dataclass
+class AppState:
+    """State shared by the interactive commands"""
+    project_path: str
+    parent_dir: str = None
+    parent_folders: list = field(default_factory=list)
+
+def _list_subdirs(path):
+    """List the names of the directories inside a path"""
+    with os.scandir(path) as it:
+        return [entry.name for entry in it if entry.is_dir()]
+
+@functools.lru_cache(maxsize=None)
 def load_config():
-    """Load configuration from config file"""
-    config_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 
-                              "config", "config.yaml")
+    """Load configuration from config file, parsing it only once"""
+    import yaml
+    
     try:
-        with open(config_path, 'r') as file:
+        with open(_CONFIG_PATH, 'r') as file:
             return yaml.safe_load(file)
     except Exception as e:
         console.print(f"[bold red]Error loading config: {str(e)}[/bold red]")
@@ -53,6 +95,10 @@ def main(
     console.print(f"Using model: [bold green]{model_name}[/bold green]")
     
     # Initialize components
+    from src.llm_manager import LLMManager
+    from src.project_analyzer import ProjectAnalyzer
+    from src.code_generator import CodeGenerator
+    
     llm_manager = LLMManager(config)
     project_analyzer = ProjectAnalyzer(config)
     code_generator = CodeGenerator(llm_manager)
@@ -60,32 +106,37 @@ def main(
     # Debug mode
     if debug:
         console.print("[bold yellow]Debug mode enabled[/bold yellow]")
+        # Batched requests only run in parallel if the Ollama server allows it
+        num_parallel = os.environ.get("OLLAMA_NUM_PARALLEL")
+        console.print(f"[dim]OLLAMA_NUM_PARALLEL: {num_parallel or 'not set (server default)'} - "
+                      "start 'ollama serve' with OLLAMA_NUM_PARALLEL=N to run N requests at once[/dim]")
         
     # Conversation history mode
     if save_history:
         console.print("[bold yellow]Conversation history will be saved[/bold yellow]")
     
-    # Scan project
-    console.print("[bold]Analyzing project structure...[/bold]")
-    project_info = project_analyzer.analyze_project(project_path)
+    # Scan the project and list the parent directory (if enabled) at the same time
+    state = AppState(project_path)
+    if parent_context:
+        state.parent_dir = os.path.dirname(os.path.abspath(project_path))
+    
+    with console.status("[bold]Analyzing project structure...[/bold]"):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            project_future = executor.submit(project_analyzer.analyze_project, project_path)
+            folders_future = executor.submit(_list_subdirs, state.parent_dir) if state.parent_dir else None
+            project_info = project_future.result()
+            if folders_future:
+                state.parent_folders = folders_future.result()
     console.print(f"Found [bold]{project_info['file_count']}[/bold] files in project")
     
-    # Get parent directory context if enabled
-    parent_context_info = None
-    if parent_context:
-        parent_dir = os.path.dirname(os.path.abspath(project_path))
-        console.print(f"[bold]Using parent folder as additional context: {os.path.basename(parent_dir)}[/bold]")
-        parent_folders = []
-        for item in os.listdir(parent_dir):
-            item_path = os.path.join(parent_dir, item)
-            if os.path.isdir(item_path):
-                parent_folders.append(item)
-        console.print(f"Available folders in parent directory: [bold]{', '.join(parent_folders)}[/bold]")
+    if state.parent_dir:
+        console.print(f"[bold]Using parent folder as additional context: {os.path.basename(state.parent_dir)}[/bold]")
+        console.print(f"Available folders in parent directory: [bold]{', '.join(state.parent_folders)}[/bold]")
     
     # Start interactive loop
-    run_interactive_loop(llm_manager, project_analyzer, code_generator, project_path, parent_context, parent_dir if parent_context else None, save_history)
+    run_interactive_loop(llm_manager, project_analyzer, code_generator, state, save_history)
 
-def run_interactive_loop(llm_manager, project_analyzer, code_generator, project_path, parent_context, parent_dir, save_history):
+def run_interactive_loop(llm_manager, project_analyzer, code_generator, state, save_history):
     """Run the interactive command loop"""
     from prompt_toolkit import PromptSession
     from prompt_toolkit.history import FileHistory
@@ -98,21 +149,9 @@ def run_interactive_loop(llm_manager, project_analyzer, code_generator, project_
     )
     
     # Initialize conversation history
-    conversation_history = []
+    conversation_file = None
     if save_history:
-        # Create a timestamped history file name
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        history_folder = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "history")
-        os.makedirs(history_folder, exist_ok=True)
-        conversation_file = os.path.join(history_folder, f"conversation_{timestamp}.md")
-        console.print(f"[bold]Saving conversation to: {conversation_file}[/bold]")
-        
-        # Write header to the file
-        with open(conversation_file, 'w') as f:
-            f.write(f"# Offline Code Assistant Conversation - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            f.write(f"Model: {llm_manager.model_name}\n")
-            f.write(f"Project: {os.path.basename(os.path.abspath(project_path))}\n\n")
-            f.write("---\n\n")
+        conversation_file = start_conversation(llm_manager, state.project_path)
     
     while True:
         try:
@@ -126,64 +165,48 @@ def run_interactive_loop(llm_manager, project_analyzer, code_generator, project_
                 continue
             
             # Save user input to conversation history
-            if save_history:
-                conversation_history.append(("user", user_input))
-                save_conversation(conversation_file, conversation_history)
+            if conversation_file:
+                save_conversation(conversation_file, ("user", user_input))
                 
             if user_input == "help":
                 show_help()
+            elif user_input == "cache stats":
+                show_cache_stats(llm_manager)
             elif user_input.startswith("analyze "):
                 file_path = user_input[8:].strip()
-                analyze_file(project_analyzer, llm_manager, file_path, project_path, save_history, conversation_history, conversation_file)
+                analyze_file(project_analyzer, llm_manager, file_path, state.project_path, conversation_file)
+            elif user_input.startswith("analyze_all "):
+                pattern = user_input[12:].strip()
+                analyze_files_batch(project_analyzer, llm_manager, pattern, state.project_path, conversation_file)
             elif user_input.startswith("repo "):
                 folder_name = user_input[5:].strip()
-                analyze_repo(project_analyzer, llm_manager, folder_name, parent_dir, save_history, conversation_history, conversation_file)
+                analyze_repo(project_analyzer, llm_manager, folder_name, state, conversation_file)
             elif user_input.startswith("error "):
                 error_text = user_input[6:].strip()
-                analyze_error(llm_manager, error_text, project_path, save_history, conversation_history, conversation_file)
+                analyze_error(llm_manager, error_text, state.project_path, conversation_file)
             elif user_input.startswith("generate "):
                 prompt = user_input[9:].strip()
-                generate_code(code_generator, prompt, project_path, save_history, conversation_history, conversation_file)
+                generate_code(code_generator, prompt, state.project_path, conversation_file)
             elif user_input.startswith("save_history "):
-                if not save_history:
+                if not conversation_file:
                     console.print("[bold yellow]Enabling conversation history saving...[/bold yellow]")
-                    save_history = True
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    history_folder = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "history")
-                    os.makedirs(history_folder, exist_ok=True)
-                    conversation_file = os.path.join(history_folder, f"conversation_{timestamp}.md")
-                    console.print(f"[bold]Saving conversation to: {conversation_file}[/bold]")
-                    
-                    # Write header to the file
-                    with open(conversation_file, 'w') as f:
-                        f.write(f"# Offline Code Assistant Conversation - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                        f.write(f"Model: {llm_manager.model_name}\n")
-                        f.write(f"Project: {os.path.basename(os.path.abspath(project_path))}\n\n")
-                        f.write("---\n\n")
+                    conversation_file = start_conversation(llm_manager, state.project_path)
                 else:
                     new_filename = user_input[13:].strip()
                     if new_filename:
-                        history_folder = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "history")
-                        new_file = os.path.join(history_folder, f"{new_filename}.md")
+                        new_file = _HISTORY_DIR / f"{new_filename}.md"
+                        
+                        # Copy the existing history to the new file and keep appending there
+                        shutil.copyfile(conversation_file, new_file)
                         conversation_file = new_file
                         console.print(f"[bold]Now saving conversation to: {conversation_file}[/bold]")
-                        
-                        # Write existing history to the new file
-                        with open(conversation_file, 'w') as f:
-                            f.write(f"# Offline Code Assistant Conversation - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-                            f.write(f"Model: {llm_manager.model_name}\n")
-                            f.write(f"Project: {os.path.basename(os.path.abspath(project_path))}\n\n")
-                            f.write("---\n\n")
-                            save_conversation(conversation_file, conversation_history)
             else:
                 # Default: Send to LLM
-                response = llm_manager.query(user_input)
-                console.print(Panel(response, border_style="green"))
+                response = stream_response(llm_manager, user_input)
                 
                 # Save response to conversation history
-                if save_history:
-                    conversation_history.append(("assistant", response))
-                    save_conversation(conversation_file, conversation_history)
+                if conversation_file:
+                    save_conversation(conversation_file, ("assistant", response))
                 
         except KeyboardInterrupt:
             console.print("\n[bold]Interrupted. Press Ctrl+C again to exit.[/bold]")
@@ -195,45 +218,76 @@ def run_interactive_loop(llm_manager, project_analyzer, code_generator, project_
         except Exception as e:
             console.print(f"[bold red]Error: {str(e)}[/bold red]")
 
-def save_conversation(file_path, conversation_history):
-    """Save the conversation history to a file"""
+def stream_response(llm_manager, prompt, title=None):
+    """Stream the LLM response into a panel and return the full text"""
+    from rich.live import Live
+    from rich.spinner import Spinner
+    
+    response = ""
+    # The spinner is replaced by the response panel as soon as the first token arrives
+    with Live(Spinner("dots", text="[dim]Thinking...[/dim]"), console=console, refresh_per_second=10) as live:
+        for chunk in llm_manager.query_stream(prompt):
+            response += chunk
+            live.update(Panel(response, border_style="green", title=title))
+    return response.strip()
+
+def start_conversation(llm_manager, project_path):
+    """Create a timestamped conversation history file with its header and return its path"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    _HISTORY_DIR.mkdir(exist_ok=True)
+    conversation_file = _HISTORY_DIR / f"conversation_{timestamp}.md"
+    console.print(f"[bold]Saving conversation to: {conversation_file}[/bold]")
+    
+    # Write header to the file
+    with open(conversation_file, 'w') as f:
+        f.write(f"# Offline Code Assistant Conversation - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
+        f.write(f"Model: {llm_manager.model_name}\n")
+        f.write(f"Project: {os.path.basename(os.path.abspath(project_path))}\n\n")
+        f.write("---\n\n")
+    
+    return conversation_file
+
+def save_conversation(file_path, message):
+    """Append a (role, content) message to the conversation history file"""
+    role, content = message
     try:
-        # Write header and conversation content to the file
-        with open(file_path, 'w') as f:
-            f.write(f"# Offline Code Assistant Conversation - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-            
-            # Write each message in the conversation history
-            for role, content in conversation_history:
-                if role == "user":
-                    f.write(f"## User\n\n```\n{content}\n```\n\n")
-                else:
-                    f.write(f"## Assistant\n\n{content}\n\n")
+        with open(file_path, 'a', buffering=1) as f:
+            if role == "user":
+                f.write(f"## User\n\n```\n{content}\n```\n\n")
+            else:
+                f.write(f"## Assistant\n\n{content}\n\n")
     except Exception as e:
         console.print(f"[bold red]Error saving conversation: {str(e)}[/bold red]")
 
-def analyze_file(project_analyzer, llm_manager, file_path, project_path, save_history=False, conversation_history=None, conversation_file=None):
+def analyze_file(project_analyzer, llm_manager, file_path, project_path, conversation_file=None):
     """Analyze a specific file"""
+    from rich.syntax import Syntax
+    from rich.text import Text
+    
     try:
         full_path = os.path.join(project_path, file_path)
-        if not os.path.exists(full_path):
-            console.print(f"[bold red]File not found: {file_path}[/bold red]")
-            return
-        
-        file_content = project_analyzer.read_file(full_path)
-        file_info = project_analyzer.analyze_file(full_path, file_content)
+        file_info = project_analyzer.analyze_file(full_path)
         
         console.print(Panel(
             f"[bold]File Analysis: {file_path}[/bold]\n\n"
             f"Type: {file_info['type']}\n"
             f"Lines: {file_info['lines']}\n"
-            f"Functions/Classes: {len(file_info.get('functions', []))}\n",
+            f"Functions/Classes: {len(file_info.get('functions', []))}\n"
+            + ("[dim]Large file: only the start was scanned for functions/classes[/dim]\n" if file_info.get('truncated') else ""),
             border_style="blue"
         ))
         
         ext = file_info['type']
         if ext in ('py', 'js', 'c', 'cpp', 'h', 'md', 'txt', 'json', 'yaml', 'yml'):
-            syntax = Syntax(file_content, ext, line_numbers=True)
-            console.print(syntax)
+            # Highlighting tokenizes the whole text, so large files are shown as the plain start of the file
+            # 'size' counts bytes, so decide on the decoded length: read one character past the limit
+            display_content = project_analyzer.read_file_head(full_path, _MAX_DISPLAY_CHARS + 1)
+            if len(display_content) <= _MAX_DISPLAY_CHARS:
+                syntax = Syntax(display_content, ext, line_numbers=True, theme="ansi_dark")
+                console.print(syntax)
+            else:
+                console.print(Text(display_content[:_MAX_DISPLAY_CHARS]))
+                console.print(f"[dim]...truncated to {_MAX_DISPLAY_CHARS} characters (file is {file_info['size']} bytes)[/dim]")
             
             # Ask LLM to analyze the file
             prompt = f"""
@@ -243,35 +297,113 @@ File type: {ext}
 Lines: {file_info['lines']}
 
 Content (first 100 lines or less):
-{file_content[:10000] if len(file_content) > 10000 else file_content}
+{project_analyzer.read_file_head(full_path, _MAX_PROMPT_CHARS)}
 
 Provide a concise analysis of the file's purpose and structure.
 """
-            response = llm_manager.query(prompt)
-            console.print(Panel(response, border_style="green", title="File Analysis"))
+            response = stream_response(llm_manager, prompt, title="File Analysis")
             
             # Save the response to the conversation history if enabled
-            if save_history and conversation_history is not None and conversation_file is not None:
-                conversation_history.append(("assistant", response))
-                save_conversation(conversation_file, conversation_history)
+            if conversation_file:
+                save_conversation(conversation_file, ("assistant", response))
+    except FileNotFoundError:
+        console.print(f"[bold red]File not found: {file_path}[/bold red]")
     except Exception as e:
         console.print(f"[bold red]Error analyzing file: {str(e)}[/bold red]")
 
-def analyze_repo(project_analyzer, llm_manager, folder_name, parent_dir, save_history=False, conversation_history=None, conversation_file=None):
+def _match_glob(parts, segments):
+    """
+    Match path components against glob pattern segments, where '**' matches any number of directories.
+    As with glob, names starting with '.' only match a segment that starts with '.' and '**' skips them.
+    """
+    if not segments:
+        return not parts
+    if segments[0] == '**':
+        for i in range(len(parts) + 1):
+            if _match_glob(parts[i:], segments[1:]):
+                return True
+            if i < len(parts) and parts[i].startswith('.'):
+                return False
+        return False
+    if not parts or (parts[0].startswith('.') and not segments[0].startswith('.')):
+        return False
+    return fnmatch.fnmatch(parts[0], segments[0]) and _match_glob(parts[1:], segments[1:])
+
+def analyze_files_batch(project_analyzer, llm_manager, pattern, project_path, conversation_file=None):
+    """Analyze all files matching a glob pattern, packing several files into each LLM request"""
+    try:
+        # Walk the project rather than globbing, so ignored directories (node_modules, venv, ...) are skipped
+        segments = pattern.replace(os.sep, '/').split('/')
+        # Paths from the walk are relative to the project, so './src/*.py' means 'src/*.py'
+        while len(segments) > 1 and segments[0] == '.':
+            segments.pop(0)
+        files = sorted(
+            rel_path for rel_path, _ in project_analyzer.iter_files(project_path)
+            if _match_glob(rel_path.split(os.sep), segments)
+        )
+        if not files:
+            console.print(f"[bold red]No files match: {pattern}[/bold red]")
+            return
+        
+        # Keep each request within ~80% of the model's token budget (~4 characters per token)
+        max_tokens = llm_manager.get_current_model_info().get('max_tokens', 4000)
+        budget = int(max_tokens * 0.8) * 4
+        
+        batches = []
+        sections = []
+        size = 0
+        for file in files:
+            content = project_analyzer.read_file_head(os.path.join(project_path, file), min(budget, _MAX_PROMPT_CHARS))
+            section = f"## {file}\n{content}\n"
+            if sections and size + len(section) > budget:
+                batches.append(sections)
+                sections = []
+                size = 0
+            sections.append(section)
+            size += len(section)
+        batches.append(sections)
+        
+        if len(batches) > _BATCH_CONFIRM_REQUESTS and not typer.confirm(
+            f"{len(files)} files need {len(batches)} requests. Continue?", default=False
+        ):
+            return
+        
+        console.print(f"[bold]Analyzing {len(files)} files in {len(batches)} request(s)...[/bold]")
+        prompts = [f"""
+Analyze each of the following files. Respond only with a JSON object mapping each filename to a concise summary of its purpose and structure.
+
+{''.join(sections)}
+""" for sections in batches]
+        responses = llm_manager.query_many(prompts) if len(prompts) > 1 else [llm_manager.query(prompts[0])]
+        
+        for response in responses:
+            try:
+                summaries = json.loads(response[response.find('{'):response.rfind('}') + 1])
+                for file, summary in summaries.items():
+                    console.print(Panel(str(summary), border_style="green", title=file))
+            except (ValueError, AttributeError):
+                # The model did not return the requested JSON, show its answer as is
+                console.print(Panel(response, border_style="green", title="File Analysis"))
+            
+            # Save the response to the conversation history if enabled
+            if conversation_file:
+                save_conversation(conversation_file, ("assistant", response))
+    except Exception as e:
+        console.print(f"[bold red]Error analyzing files: {str(e)}[/bold red]")
+
+def analyze_repo(project_analyzer, llm_manager, folder_name, state, conversation_file=None):
     """Analyze a repository in the parent directory"""
-    if not parent_dir:
+    if not state.parent_dir:
         console.print("[bold red]Parent directory context is not enabled. Use --parent-context flag.[/bold red]")
         return
     
     try:
-        folder_path = os.path.join(parent_dir, folder_name)
-        if not os.path.exists(folder_path) or not os.path.isdir(folder_path):
+        folder_path = os.path.join(state.parent_dir, folder_name)
+        if not os.path.isdir(folder_path):
             console.print(f"[bold red]Folder not found: {folder_name}[/bold red]")
             console.print("Available folders:")
-            for item in os.listdir(parent_dir):
-                item_path = os.path.join(parent_dir, item)
-                if os.path.isdir(item_path):
-                    console.print(f"  - {item}")
+            for item in state.parent_folders:
+                console.print(f"  - {item}")
             return
         
         console.print(f"[bold]Analyzing folder: {folder_name}[/bold]")
@@ -297,17 +429,15 @@ Important Files: {', '.join(project_summary['important_files'])}
 
 Provide a concise project description and assessment.
 """
-        response = llm_manager.query(prompt)
-        console.print(Panel(response, border_style="green", title="AI Analysis"))
+        response = stream_response(llm_manager, prompt, title="AI Analysis")
         
         # Save the response to the conversation history if enabled
-        if save_history and conversation_history is not None and conversation_file is not None:
-            conversation_history.append(("assistant", response))
-            save_conversation(conversation_file, conversation_history)
+        if conversation_file:
+            save_conversation(conversation_file, ("assistant", response))
     except Exception as e:
         console.print(f"[bold red]Error analyzing repository: {str(e)}[/bold red]")
 
-def analyze_error(llm_manager, error_text, project_path, save_history=False, conversation_history=None, conversation_file=None):
+def analyze_error(llm_manager, error_text, project_path, conversation_file=None):
     """Analyze a specific error message"""
     console.print(Panel(f"[bold]Analyzing Error:[/bold]\n\n{error_text}", border_style="yellow"))
     
@@ -323,37 +453,54 @@ Provide:
 2. Potential solutions
 3. Debugging steps to locate the issue
 """
-    response = llm_manager.query(prompt)
-    console.print(Panel(response, border_style="green", title="Error Analysis"))
+    response = stream_response(llm_manager, prompt, title="Error Analysis")
     
     # Save the response to the conversation history if enabled
-    if save_history and conversation_history is not None and conversation_file is not None:
-        conversation_history.append(("assistant", response))
-        save_conversation(conversation_file, conversation_history)
+    if conversation_file:
+        save_conversation(conversation_file, ("assistant", response))
 
-def generate_code(code_generator, prompt, project_path, save_history=False, conversation_history=None, conversation_file=None):
+def generate_code(code_generator, prompt, project_path, conversation_file=None):
     """Generate code based on prompt"""
     try:
         code = code_generator.generate(prompt, project_path)
         console.print(Panel(code, border_style="green", title="Generated Code"))
         
         # Save the response to the conversation history if enabled
-        if save_history and conversation_history is not None and conversation_file is not None:
-            conversation_history.append(("assistant", code))
-            save_conversation(conversation_file, conversation_history)
+        if conversation_file:
+            save_conversation(conversation_file, ("assistant", code))
     except Exception as e:
         console.print(f"[bold red]Error generating code: {str(e)}[/bold red]")
 
+def show_cache_stats(llm_manager):
+    """Show response cache statistics"""
+    caches = [
+        ("Program", llm_manager.program_cache),
+        ("Exact", llm_manager.cache),
+        ("Semantic", llm_manager.semantic_cache),
+    ]
+    caches = [(name, cache) for name, cache in caches if cache is not None]
+    if not caches:
+        console.print("[bold yellow]Response cache is disabled.[/bold yellow]")
+        return
+    
+    lines = []
+    for name, cache in caches:
+        stats = cache.stats()
+        lines.append(f"[bold]{name}[/bold] - Hits: {stats['hits']}, Misses: {stats['misses']}, Entries: {stats['entries']}")
+    console.print(Panel('\n'.join(lines), border_style="blue", title="Cache Stats"))
+
 def show_help():
     """Show help information"""
     help_text = """
     [bold]Offline Code Assistant Commands:[/bold]
     
     analyze <file>  - Analyze a specific file in the current project
+    analyze_all <glob> - Analyze all matching files with batched requests
     repo <folder>   - Analyze a folder from the parent directory
     error <text>    - Analyze an error message
     generate <desc> - Generate code based on description
     save_history [name] - Enable saving conversation history or change filename
+    cache stats     - Show response cache hits and misses
     help            - Show this help message
     exit/quit       - Exit the application
     
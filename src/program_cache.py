@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+import re
+import string
+from rich.console import Console
+
+console = Console()
+
+class ProgramCache:
+    """
+    Answers templated prompts with a regex + response template instead of the LLM
+    """
+    
+    def __init__(self, patterns=None, context_names=()):
+        # Names passed to try_match as keyword arguments; patterns may not reuse them as groups
+        self.context_names = frozenset(context_names)
+        self.patterns = []
+        self.hits = 0
+        self.misses = 0
+        for entry in patterns or []:
+            self.add(entry['pattern'], entry['response'])
+    
+    def add(self, pattern, template):
+        """
+        Compile and register a pattern with its response template.
+        Invalid patterns and templates are reported and skipped.
+        """
+        try:
+            compiled = re.compile(pattern, re.IGNORECASE | re.DOTALL)
+        except re.error as e:
+            console.print(f"[bold red]Invalid program cache pattern '{pattern}': {str(e)}[/bold red]")
+            return False
+        
+        groups = set(compiled.groupindex)
+        if reserved := groups & self.context_names:
+            console.print(f"[bold red]Invalid program cache pattern '{pattern}': "
+                          f"group names {', '.join(sorted(reserved))} are reserved[/bold red]")
+            return False
+        
+        # Every placeholder must be a named group or a context name, so try_match cannot fail on it
+        try:
+            fields = {name for _, name, _, _ in string.Formatter().parse(template) if name is not None}
+        except ValueError as e:
+            console.print(f"[bold red]Invalid program cache template for '{pattern}': {str(e)}[/bold red]")
+            return False
+        unknown = {re.split(r'[.\[]', name, 1)[0] for name in fields} - groups - self.context_names
+        if unknown:
+            console.print(f"[bold red]Invalid program cache template for '{pattern}': "
+                          f"unknown placeholders {', '.join(sorted(repr(name) for name in unknown))} "
+                          "(use {{ and }} for literal braces)[/bold red]")
+            return False
+        
+        self.patterns.append((compiled, template))
+        return True
+    
+    def try_match(self, prompt, **context):
+        """
+        Return the filled-in template of the first pattern matching the whole prompt, or None.
+        Named groups in the pattern and the keyword arguments are available to the template.
+        """
+        prompt = prompt.strip()
+        for pattern, template in self.patterns:
+            if (match := pattern.fullmatch(prompt)):
+                try:
+                    response = template.format_map({**context, **match.groupdict()})
+                except (KeyError, IndexError, AttributeError, ValueError) as e:
+                    # Fall through to the LLM rather than failing the query
+                    console.print(f"[bold red]Error filling program cache template: {str(e)}[/bold red]")
+                    break
+                self.hits += 1
+                return response
+        
+        self.misses += 1
+        return None
+    
+    def stats(self):
+        """Return hit/miss counters and the number of patterns"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(self.patterns),
+        }
@@ -2,11 +2,164 @@
 
 import os
 import re
+import sys
+import mmap
 import fnmatch
+import functools
+import threading
+from array import array
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from rich.console import Console
 
+# google-re2 matches in linear time, so large or unusual source files cannot make the
+# language analyzers backtrack; use it when installed. It is only used for bytes: for
+# text, its \w and \s are ASCII-only, unlike re's, so names like 'café' would be cut short.
+try:
+    import re2 as _re
+    # Match bytes as bytes, so the class below can accept any byte of a UTF-8 sequence
+    _RE2_OPTIONS = _re.Options()
+    _RE2_OPTIONS.encoding = _re.Options.Encoding.LATIN1
+except ImportError:
+    _re = re
+
+# Hyperscan, if installed, finds the lines the Python analyzer needs to look at
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 console = Console()
 
+# Bytes patterns use this instead of \w, which only matches ASCII in bytes. Accepting every
+# non-ASCII byte keeps UTF-8 names like 'größe' whole; they are decoded after matching.
+_BYTES_WORD = r'[0-9A-Za-z_\x80-\xff]'
+
+def _compile(pattern):
+    """Compile a bytes analyzer pattern, with re2 if available, falling back to re for syntax re2 does not support"""
+    if _re is re:
+        return re.compile(pattern)
+    try:
+        return _re.compile(pattern, _RE2_OPTIONS)
+    except _re.error:
+        return re.compile(pattern)
+
+def _compile_pair(pattern, compile=_compile):
+    """
+    Compile a pattern for text and for bytes. Analyzers index the pair with
+    `binary`, picking the bytes form for raw or memory-mapped file contents.
+    The text form always uses re, so its results do not depend on re2 being installed.
+    """
+    return re.compile(pattern), compile(pattern.replace(r'\w', _BYTES_WORD).encode())
+
+# Patterns for the regex-based language analysis, compiled once.
+# Python uses one pattern with named alternatives so a file is scanned in a single pass.
+# It is anchored at line starts, so it cannot backtrack far, and stays on re: re2's
+# per-match overhead makes it several times slower for a pattern with this many matches.
+_PY_RE = _compile_pair(
+    r'(?m)^(?:'
+    r'(?:from\s+(?P<from>\S+)\s+)?import\s+(?P<import>.+)$'
+    r'|def\s+(?P<function>[^\s(]+)'
+    r'|class\s+(?P<class>[^\s:(]+)'
+    r')',
+    compile=re.compile
+)
+
+# Hyperscan has no capture groups, so it only locates the line starts where _PY_RE can match;
+# re then extracts the names there. This needs the content as bytes.
+_PY_STARTS_DB = None
+if hyperscan is not None:
+    try:
+        _PY_STARTS_DB = hyperscan.Database()
+        _PY_STARTS_DB.compile(
+            expressions=[rb'^(?:from|import|def|class)\s'],
+            ids=[0],
+            elements=1,
+            flags=[hyperscan.HS_FLAG_MULTILINE | hyperscan.HS_FLAG_SOM_LEFTMOST]
+        )
+    except hyperscan.error:
+        # e.g. a CPU without the instructions Hyperscan needs
+        _PY_STARTS_DB = None
+
+# Hyperscan scratch space cannot be shared between threads
+_hyperscan_local = threading.local()
+
+def _python_matches(content, binary):
+    """Yield the matches of _PY_RE in content, in the same order as finditer"""
+    if not binary or _PY_STARTS_DB is None:
+        yield from _PY_RE[binary].finditer(content)
+        return
+    
+    scratch = getattr(_hyperscan_local, 'scratch', None)
+    if scratch is None:
+        scratch = _hyperscan_local.scratch = hyperscan.Scratch(_PY_STARTS_DB)
+    
+    starts = []
+    _PY_STARTS_DB.scan(
+        content,
+        match_event_handler=lambda id, start, end, flags, context: starts.append(start),
+        scratch=scratch
+    )
+    
+    match = _PY_RE[binary].match
+    last_end = 0
+    for start in starts:
+        # A match can span lines; finditer would not look inside it again
+        if start < last_end:
+            continue
+        found = match(content, start)
+        if found:
+            last_end = found.end()
+            yield found
+
+# C/C++ and JavaScript keep separate patterns: each has a literal prefix the regex
+# engine can search for, which makes them faster than a combined alternation.
+# The unanchored function patterns backtrack heavily on re, so bytes scans use re2 if available.
+_C_INCLUDE_RE = _compile_pair(r'#include\s+[<"]([^>"]+)[>"]')
+_C_FUNC_RE = _compile_pair(r'(\w+)\s+(\w+)\s*\([^)]*\)\s*\{')
+_C_STRUCT_RE = _compile_pair(r'(struct|class|enum)\s+(\w+)')
+
+_JS_IMPORT_RE = _compile_pair(r'(import|require)\s+.+?[\'"]([^\'"]+)[\'"]')
+_JS_FUNC_RE = _compile_pair(r'function\s+(\w+)|(\w+)\s*=\s*function')
+_JS_CLASS_RE = _compile_pair(r'class\s+(\w+)')
+
+# File types with a language-specific analyzer
+_ANALYZED_TYPES = ('py', 'js', 'c', 'cpp', 'h')
+
+# Whether os.path.normcase folds case (Windows); elsewhere it returns names unchanged
+_FOLD_CASE = os.path.normcase('A') == 'a'
+
+# Number of per-file analysis results kept between calls
+_ANALYSIS_CACHE_SIZE = 4096
+
+# Files at least this large are memory-mapped for analysis instead of read into memory
+_MMAP_MIN_BYTES = 256 * 1024
+
+# Substrings that mark a file as important in a project summary, matched in one regex pass
+_IMPORTANT_KEYS = ('main', 'index', 'app', 'config')
+_IMPORTANT_RE = re.compile('|'.join(_IMPORTANT_KEYS))
+
+def _extension(name):
+    """
+    Return the lowercased extension of a file name, as os.path.splitext would.
+    Walk entries are bare names, so this skips splitext's separator handling.
+    Extensions are interned: a project has few distinct ones, so the per-file copies are freed
+    right away and counting hashes shared strings whose hash is already cached.
+    """
+    head, dot, tail = name.rpartition('.')
+    # Leading dots do not start an extension, like splitext
+    return sys.intern((dot + tail).lower()) if head.lstrip('.') else ''
+
+def _text(value):
+    """Decode a group captured from a bytes scan"""
+    return value.decode('utf-8', 'replace')
+
+def _count_lines(content, chunk_size=1024 * 1024):
+    """Count the lines of a str, bytes or mmap, copying at most chunk_size bytes of an mmap at a time"""
+    if not isinstance(content, mmap.mmap):
+        return content.count(b'\n' if isinstance(content, bytes) else '\n') + 1
+    return sum(content[i:i + chunk_size].count(b'\n') for i in range(0, len(content), chunk_size)) + 1
+
 class ProjectAnalyzer:
     """
     Analyzes project structure and files for context
@@ -15,16 +168,28 @@ class ProjectAnalyzer:
     def __init__(self, config):
         self.config = config
         self.ignored_dirs = config['project'].get('ignored_directories', [])
+        # Literal names are checked with a set lookup; glob patterns share one compiled regex.
+        # Names are case-normalized like fnmatch.fnmatch does.
+        patterns = [os.path.normcase(p) for p in self.ignored_dirs]
+        self._ignored_literals = frozenset(p for p in patterns if not any(c in p for c in '*?['))
+        globs = [fnmatch.translate(p) for p in patterns if p not in self._ignored_literals]
+        self._ignored_re = re.compile('|'.join(globs)) if globs else None
         self.code_extensions = config['project'].get('code_extensions', [])
-        self.file_cache = {}  # Cache for file contents
+        self.file_cache = OrderedDict()  # Cache for file contents, least recently used first
+        self.max_cache_bytes = config['project'].get('max_cache_bytes', 64 * 1024 * 1024)
+        # Only the start of larger files is scanned by the language analyzers
+        self.max_analyze_bytes = config['project'].get('max_analyze_bytes', 1_000_000)
+        self._cache_bytes = 0
+        self._cache_sizes = {}  # Size on disk in bytes of each cached file, which the budget counts
+        self._line_offsets = {}  # Newline offsets of cached files, built on first get_file_context
+        self._cache_lock = threading.Lock()  # analyze_files reads files from several threads
+        # Analysis results keyed by (path, mtime_ns, size), so a file is re-analyzed once it changes
+        self._analyze_file_cached = functools.lru_cache(maxsize=_ANALYSIS_CACHE_SIZE)(self._analyze_file_version)
     
     def analyze_project(self, project_path):
         """
         Analyze project structure and return information
         """
-        if not os.path.exists(project_path):
-            raise FileNotFoundError(f"Project path does not exist: {project_path}")
-        
         project_info = {
             'path': project_path,
             'files': [],
@@ -34,73 +199,231 @@ class ProjectAnalyzer:
             'file_types': {},
         }
         
-        for root, dirs, files in os.walk(project_path):
-            # Skip ignored directories
-            dirs[:] = [d for d in dirs if not self._is_ignored_dir(d)]
-            
-            rel_root = os.path.relpath(root, project_path)
-            if rel_root != '.':
-                project_info['directories'].append(rel_root)
+        extensions = []
+        for rel_path, entry, is_dir in self._iter_project(project_path):
+            if is_dir:
+                project_info['directories'].append(rel_path)
                 project_info['directory_count'] += 1
+                continue
             
-            for file in files:
-                file_path = os.path.join(rel_root, file)
-                if rel_root == '.':
-                    file_path = file
-                
-                project_info['files'].append(file_path)
-                project_info['file_count'] += 1
-                
-                # Track file types
-                ext = os.path.splitext(file)[1].lower()
-                if ext:
-                    project_info['file_types'][ext] = project_info['file_types'].get(ext, 0) + 1
+            project_info['files'].append(rel_path)
+            project_info['file_count'] += 1
+            extensions.append(_extension(entry.name))
+        
+        # Track file types, counted in one pass by Counter
+        file_types = Counter(extensions)
+        file_types.pop('', None)
+        project_info['file_types'] = file_types
         
         return project_info
     
-    def analyze_file(self, file_path, content=None):
+    def iter_files(self, project_path):
+        """
+        Yield (relative path, os.DirEntry) for every file in the project, skipping ignored directories.
+        The entries can be passed to analyze_file and analyze_files to reuse their stat information.
+        """
+        for rel_path, entry, is_dir in self._iter_project(project_path):
+            if not is_dir:
+                yield rel_path, entry
+    
+    def _iter_project(self, path, rel_path='', dir_entry=None):
         """
-        Analyze a single file and return information
+        Yield (relative path, os.DirEntry, is_dir) for every file and directory below path,
+        skipping ignored directories. rel_path and dir_entry describe path itself.
+        Raises FileNotFoundError if the project root does not exist.
         """
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"File does not exist: {file_path}")
+        rel_prefix = rel_path + os.sep if rel_path else ''
+        try:
+            it = os.scandir(path)
+        except FileNotFoundError:
+            if not rel_path:
+                raise FileNotFoundError(f"Project path does not exist: {path}")
+            return
+        except OSError:
+            # Skip unreadable directories, as os.walk does
+            return
         
-        if content is None:
-            content = self.read_file(file_path)
+        if dir_entry is not None:
+            yield rel_path, dir_entry, True
         
-        ext = os.path.splitext(file_path)[1].lower().lstrip('.')
+        subdirs = []
+        with it:
+            for entry in it:
+                # DirEntry caches the file type, so this does not need an extra stat call
+                if entry.is_dir():
+                    # Like os.walk, list symlinked directories but do not descend into them
+                    if not self._is_ignored_dir(entry.name) and not entry.is_symlink():
+                        subdirs.append(entry)
+                    continue
+                
+                yield rel_prefix + entry.name, entry, False
         
-        file_info = {
-            'path': file_path,
-            'type': ext,
-            'lines': content.count('\n') + 1,
-            'size': len(content),
-        }
+        for entry in subdirs:
+            yield from self._iter_project(entry.path, rel_prefix + entry.name, entry)
+    
+    def analyze_file(self, file_path, content=None):
+        """
+        Analyze a single file, given as a path or an os.DirEntry, and return information.
+        Results for files that have not changed since they were last analyzed are reused.
+        Raises FileNotFoundError if the file does not exist.
+        """
+        entry = None
+        if isinstance(file_path, os.DirEntry):
+            entry, file_path = file_path, file_path.path
         
-        # Analyze file based on type
-        if ext in ('py', 'js', 'c', 'cpp', 'h'):
-            # Add language-specific analysis
-            if ext == 'py':
-                file_info.update(self._analyze_python(content))
-            elif ext in ('c', 'cpp', 'h'):
-                file_info.update(self._analyze_c_cpp(content))
-            elif ext == 'js':
-                file_info.update(self._analyze_javascript(content))
+        if content is not None:
+            return self._analyze_content(file_path, content)
+        
+        # A DirEntry caches its stat result (on Windows it comes with the directory listing)
+        stat = entry.stat() if entry is not None else os.stat(file_path)
+        # Copy the dict and its lists so callers can update the result without changing the cached one
+        info = self._analyze_file_cached(file_path, stat.st_mtime_ns, stat.st_size)
+        return {key: list(value) if isinstance(value, list) else value for key, value in info.items()}
+    
+    def _analyze_file_version(self, file_path, mtime_ns, size):
+        """
+        Read and analyze a file. The modification time and size only serve as the cache key.
+        """
+        # Read from disk rather than file_cache, which is not invalidated when a file changes.
+        # The analyzers and the line count work on bytes, so large files are mapped rather than loaded.
+        return self._analyze_content(file_path, self.read_file_mmap(file_path))
+    
+    def _analyze_content(self, file_path, content):
+        """Analyze file contents given as text, bytes or an mmap, closing the mmap when done"""
+        # Interned like the walk's extensions, since cached results all hold one
+        ext = sys.intern(os.path.splitext(file_path)[1].lower().lstrip('.'))
+        
+        try:
+            file_info = {
+                'path': file_path,
+                'type': ext,
+                'lines': _count_lines(content),
+                'size': len(content),
+            }
+            
+            # Analyze file based on type
+            if ext in _ANALYZED_TYPES:
+                scan_content = content
+                if len(content) > self.max_analyze_bytes:
+                    # Bound the scan of huge (often generated) files; imports and definitions
+                    # are mostly near the top. Cut at a line end so no name is split.
+                    scan_content = content[:self.max_analyze_bytes]
+                    cut = scan_content.rfind('\n' if isinstance(scan_content, str) else b'\n')
+                    if cut > 0:
+                        scan_content = scan_content[:cut]
+                    file_info['truncated'] = True
+                
+                # Add language-specific analysis
+                if ext == 'py':
+                    file_info.update(self._analyze_python(scan_content))
+                elif ext in ('c', 'cpp', 'h'):
+                    file_info.update(self._analyze_c_cpp(scan_content))
+                elif ext == 'js':
+                    file_info.update(self._analyze_javascript(scan_content))
+        finally:
+            if isinstance(content, mmap.mmap):
+                content.close()
         
         return file_info
     
+    def analyze_files(self, file_paths):
+        """
+        Analyze several files, given as paths or os.DirEntry objects, overlapping their reads on a thread pool.
+        Returns a dict of file path to file information; files that could not be found are skipped.
+        """
+        results = {}
+        if not file_paths:
+            return results
+        
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(file_paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {os.fspath(path): executor.submit(self.analyze_file, path) for path in file_paths}
+            for path, future in futures.items():
+                try:
+                    results[path] = future.result()
+                except FileNotFoundError:
+                    console.print(f"[bold red]File not found: {path}[/bold red]")
+        
+        return results
+    
     def read_file(self, file_path):
         """
-        Read file contents, with caching
+        Read file contents, with caching.
+        A missing file raises FileNotFoundError; other read errors return an empty string.
         """
-        if file_path in self.file_cache:
-            return self.file_cache[file_path]
+        with self._cache_lock:
+            if file_path in self.file_cache:
+                self.file_cache.move_to_end(file_path)
+                return self.file_cache[file_path]
+        
+        try:
+            with open(file_path, 'rb') as f:
+                raw = f.read()
+            # ASCII-only files, the usual case for source code, skip the error-checking UTF-8 decoder
+            content = raw.decode('ascii') if raw.isascii() else raw.decode('utf-8', errors='replace')
+            if '\r' in content:
+                # Translate line endings like reading in text mode does
+                content = content.replace('\r\n', '\n').replace('\r', '\n')
+            with self._cache_lock:
+                self._cache_file(file_path, content, len(raw))
+            return content
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            console.print(f"[bold red]Error reading file {file_path}: {str(e)}[/bold red]")
+            return ""
+    
+    def read_file_mmap(self, file_path):
+        """
+        Map a file read-only so it can be scanned without copying or decoding it.
+        Files smaller than _MMAP_MIN_BYTES, which are cheaper to read than to map, are returned as bytes.
+        The caller closes the returned mmap. A missing file raises FileNotFoundError.
+        """
+        try:
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size < _MMAP_MIN_BYTES:
+                    return f.read()
+                # The mapping stays valid after the file is closed
+                return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            raise
+        except Exception as e:
+            console.print(f"[bold red]Error reading file {file_path}: {str(e)}[/bold red]")
+            return b""
+    
+    def _cache_file(self, file_path, content, size):
+        """
+        Add file contents of the given size in bytes to the cache, evicting the least recently
+        used files over the size budget. Must be called with _cache_lock held.
+        """
+        if size > self.max_cache_bytes:
+            return
+        
+        # Another thread may have cached the same file meanwhile
+        if self.file_cache.pop(file_path, None) is not None:
+            self._cache_bytes -= self._cache_sizes.pop(file_path)
+            self._line_offsets.pop(file_path, None)
+        
+        self.file_cache[file_path] = content
+        self._cache_sizes[file_path] = size
+        self._cache_bytes += size
+        while self._cache_bytes > self.max_cache_bytes:
+            evicted_path, _ = self.file_cache.popitem(last=False)
+            self._cache_bytes -= self._cache_sizes.pop(evicted_path)
+            self._line_offsets.pop(evicted_path, None)
+    
+    def read_file_head(self, file_path, max_chars=10000):
+        """
+        Read at most max_chars characters from the start of a file
+        """
+        with self._cache_lock:
+            content = self.file_cache.get(file_path)
+        if content is not None:
+            return content[:max_chars]
         
         try:
             with open(file_path, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-                self.file_cache[file_path] = content
-                return content
+                return f.read(max_chars)
         except Exception as e:
             console.print(f"[bold red]Error reading file {file_path}: {str(e)}[/bold red]")
             return ""
@@ -109,118 +432,151 @@ class ProjectAnalyzer:
         """
         Generate a summary of the project
         """
-        project_info = self.analyze_project(project_path)
-        
         summary = {
-            'path': project_info['path'],
-            'file_count': project_info['file_count'],
-            'directory_count': project_info['directory_count'],
-            'file_types': project_info['file_types'],
+            'path': project_path,
+            'file_count': 0,
+            'directory_count': 0,
+            'file_types': {},
             'important_files': [],
         }
         
-        # Identify important files
-        for file in project_info['files']:
-            lower_file = file.lower()
-            if any(pattern in lower_file for pattern in ('main', 'index', 'app', 'config')):
-                summary['important_files'].append(file)
+        # Count files and identify important ones in a single pass, without building the file list
+        extensions = []
+        for rel_path, entry, is_dir in self._iter_project(project_path):
+            if is_dir:
+                summary['directory_count'] += 1
+                continue
+            
+            summary['file_count'] += 1
+            extensions.append(_extension(entry.name))
+            
+            if _IMPORTANT_RE.search(rel_path.lower()):
+                summary['important_files'].append(rel_path)
+        
+        file_types = Counter(extensions)
+        file_types.pop('', None)
+        summary['file_types'] = file_types
         
         return summary
     
     def get_file_context(self, file_path, line_number=None, context_lines=5):
         """
-        Get file content with optional context around a specific line
+        Get file content with optional context around a specific line.
+        Lines are split on '\n' only, as compilers and editors number them; unlike
+        str.splitlines(), form feeds and other separators stay inside a line.
         """
         content = self.read_file(file_path)
-        lines = content.splitlines()
         
         if line_number is None:
             return content
         
-        start = max(0, line_number - context_lines - 1)
-        end = min(len(lines), line_number + context_lines)
+        offsets = self._newline_offsets(file_path, content)
+        line_count = len(offsets) + (1 if content and not content.endswith('\n') else 0)
+        
+        # Slice a range like the line list would be sliced, then cut the window out of the content
+        window = range(line_count)[max(0, line_number - context_lines - 1):line_number + context_lines]
+        if not window:
+            return ''
         
-        return '\n'.join(lines[start:end])
+        start = offsets[window[0] - 1] + 1 if window[0] else 0
+        end = offsets[window[-1]] if window[-1] < len(offsets) else len(content)
+        return content[start:end]
+    
+    def _newline_offsets(self, file_path, content):
+        """Return the offsets of the newlines in a file's content, cached while the content is cached"""
+        with self._cache_lock:
+            offsets = self._line_offsets.get(file_path)
+        if offsets is not None:
+            return offsets
+        
+        offsets = array('q')
+        pos = content.find('\n')
+        while pos != -1:
+            offsets.append(pos)
+            pos = content.find('\n', pos + 1)
+        
+        with self._cache_lock:
+            # Files too large for the content cache are re-read each time, so neither is cached
+            if self.file_cache.get(file_path) is content:
+                self._line_offsets[file_path] = offsets
+        return offsets
     
     def _is_ignored_dir(self, dir_name):
         """Check if directory should be ignored"""
-        return any(fnmatch.fnmatch(dir_name, pattern) for pattern in self.ignored_dirs)
+        if _FOLD_CASE:
+            dir_name = os.path.normcase(dir_name)
+        # Literal names, the usual case, need only a set lookup
+        if dir_name in self._ignored_literals:
+            return True
+        return self._ignored_re is not None and self._ignored_re.match(dir_name) is not None
     
     def _analyze_python(self, content):
-        """Analyze Python file"""
+        """Analyze Python file, given as text or bytes"""
         info = {
             'imports': [],
             'functions': [],
             'classes': [],
         }
+        binary = not isinstance(content, str)
+        text = _text if binary else str  # str() returns text groups unchanged
         
-        # Simple regex-based analysis
-        import_pattern = re.compile(r'^(?:from\s+(\S+)\s+)?import\s+(.+)$', re.MULTILINE)
-        function_pattern = re.compile(r'^def\s+([^\s(]+)', re.MULTILINE)
-        class_pattern = re.compile(r'^class\s+([^\s:(]+)', re.MULTILINE)
-        
-        # Extract imports
-        for match in import_pattern.finditer(content):
-            if match.group(1):  # from X import Y
-                module = match.group(1)
-                for item in match.group(2).split(','):
-                    info['imports'].append(f"{module}.{item.strip()}")
-            else:  # import X
-                for item in match.group(2).split(','):
-                    info['imports'].append(item.strip())
-        
-        # Extract functions and classes
-        info['functions'] = [match.group(1) for match in function_pattern.finditer(content)]
-        info['classes'] = [match.group(1) for match in class_pattern.finditer(content)]
+        # Extract imports, functions and classes
+        for match in _python_matches(content, binary):
+            kind = match.lastgroup
+            if kind == 'import':
+                module = match.group('from')
+                for item in text(match.group('import')).split(','):
+                    if module:  # from X import Y
+                        info['imports'].append(f"{text(module)}.{item.strip()}")
+                    else:  # import X
+                        info['imports'].append(item.strip())
+            elif kind == 'function':
+                info['functions'].append(text(match.group('function')))
+            else:
+                info['classes'].append(text(match.group('class')))
         
         return info
     
     def _analyze_c_cpp(self, content):
-        """Analyze C/C++ file"""
+        """Analyze C/C++ file, given as text or bytes"""
         info = {
             'includes': [],
             'functions': [],
             'structs': [],
         }
-        
-        # Simple regex-based analysis
-        include_pattern = re.compile(r'#include\s+[<"]([^>"]+)[>"]', re.MULTILINE)
-        function_pattern = re.compile(r'(\w+)\s+(\w+)\s*\([^)]*\)\s*{', re.MULTILINE)
-        struct_pattern = re.compile(r'(struct|class|enum)\s+(\w+)', re.MULTILINE)
+        binary = not isinstance(content, str)
+        text = _text if binary else str
         
         # Extract includes, functions, and structs
-        info['includes'] = [match.group(1) for match in include_pattern.finditer(content)]
+        info['includes'] = [text(match.group(1)) for match in _C_INCLUDE_RE[binary].finditer(content)]
         
-        for match in function_pattern.finditer(content):
-            if match.group(1) not in ('if', 'for', 'while', 'switch'):
-                info['functions'].append(match.group(2))
+        for match in _C_FUNC_RE[binary].finditer(content):
+            if text(match.group(1)) not in ('if', 'for', 'while', 'switch'):
+                info['functions'].append(text(match.group(2)))
         
-        for match in struct_pattern.finditer(content):
-            info['structs'].append(f"{match.group(1)} {match.group(2)}")
+        for match in _C_STRUCT_RE[binary].finditer(content):
+            info['structs'].append(f"{text(match.group(1))} {text(match.group(2))}")
         
         return info
     
     def _analyze_javascript(self, content):
-        """Analyze JavaScript file"""
+        """Analyze JavaScript file, given as text or bytes"""
         info = {
             'imports': [],
             'functions': [],
             'classes': [],
         }
-        
-        # Simple regex-based analysis
-        import_pattern = re.compile(r'(import|require)\s+.+?[\'"]([^\'"]+)[\'"]', re.MULTILINE)
-        function_pattern = re.compile(r'function\s+(\w+)|(\w+)\s*=\s*function', re.MULTILINE)
-        class_pattern = re.compile(r'class\s+(\w+)', re.MULTILINE)
+        binary = not isinstance(content, str)
+        text = _text if binary else str
         
         # Extract imports, functions, and classes
-        info['imports'] = [match.group(2) for match in import_pattern.finditer(content)]
+        info['imports'] = [text(match.group(2)) for match in _JS_IMPORT_RE[binary].finditer(content)]
         
-        for match in function_pattern.finditer(content):
+        for match in _JS_FUNC_RE[binary].finditer(content):
             func_name = match.group(1) or match.group(2)
             if func_name:
-                info['functions'].append(func_name)
+                info['functions'].append(text(func_name))
         
-        info['classes'] = [match.group(1) for match in class_pattern.finditer(content)]
+        info['classes'] = [text(match.group(1)) for match in _JS_CLASS_RE[binary].finditer(content)]
         
-        return info 
\ No newline at end of file
+        return info
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+
+"""
+Regression checks for the project analyzer and the response caches
+Runs offline: no Ollama server is needed
+"""
+
+import os
+import sys
+import time
+import tempfile
+import importlib.util
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Non-ASCII names must be found whole, whichever regex engine scans the file
+CORPUS = {
+    'u.py': (
+        'from paquete import función, clase\ndef größe():\n    pass\nclass Ünit:\n    pass\n',
+        {'imports': ['paquete.función', 'paquete.clase'], 'functions': ['größe'], 'classes': ['Ünit']},
+    ),
+    'u.js': (
+        'import { x } from "módulo";\nfunction café() {}\nvar naïve = function() {}\n'
+        'class Ünit {}\nconst 日本 = function() {}\n',
+        {'imports': ['módulo'], 'functions': ['café', 'naïve', '日本'], 'classes': ['Ünit']},
+    ),
+    'u.c': (
+        '#include "größe.h"\nint größe(int x) {\n  return x;\n}\nstruct Über { int a; };\nenum Farbe { ROT };\n',
+        {'includes': ['größe.h'], 'functions': ['größe'], 'structs': ['struct Über', 'enum Farbe']},
+    ),
+}
+
+def _load_analyzer(stdlib_only=False):
+    """Import project_analyzer, optionally with google-re2 and hyperscan blocked so only re is used"""
+    if not stdlib_only:
+        from src import project_analyzer
+        return project_analyzer
+    
+    saved = {name: sys.modules.get(name) for name in ('re2', 'hyperscan')}
+    # A None entry makes the import raise ImportError
+    sys.modules.update(dict.fromkeys(saved))
+    try:
+        path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'project_analyzer.py')
+        spec = importlib.util.spec_from_file_location('_project_analyzer_stdlib', path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module
+    finally:
+        for name, module in saved.items():
+            if module is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = module
+
+def _check_corpus(module, directory):
+    """Analyze the corpus from disk, as text and from an mmap, and compare with the expected names"""
+    analyzer = module.ProjectAnalyzer({'project': {}})
+    for name, (source, expected) in CORPUS.items():
+        path = os.path.join(directory, name)
+        on_disk = analyzer.analyze_file(path)
+        as_text = analyzer.analyze_file(path, content=source)
+        for info in (on_disk, as_text):
+            found = {key: info.get(key) for key in expected}
+            assert found == expected, f"{name}: expected {expected}, got {found}"
+        assert on_disk['size'] == len(source.encode('utf-8')), f"{name}: size is not in bytes"
+        assert on_disk['lines'] == as_text['lines'], f"{name}: line counts differ"
+    
+    # Files above _MMAP_MIN_BYTES are scanned from a memory map
+    source, expected = CORPUS['u.js']
+    path = os.path.join(directory, 'big.js')
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(source * (module._MMAP_MIN_BYTES // len(source) + 1))
+    info = analyzer.analyze_file(path)
+    assert set(info['functions']) == set(expected['functions']), f"big.js: got {set(info['functions'])}"
+
+def test_analyzer():
+    """Test that both regex paths keep non-ASCII names whole"""
+    try:
+        with tempfile.TemporaryDirectory() as directory:
+            for name, (source, _) in CORPUS.items():
+                with open(os.path.join(directory, name), 'w', encoding='utf-8') as file:
+                    file.write(source)
+            
+            _check_corpus(_load_analyzer(), directory)
+            _check_corpus(_load_analyzer(stdlib_only=True), directory)
+        
+        print("✅ Analyzer results match on every regex path!")
+        return True
+    except Exception as e:
+        print(f"❌ Analyzer error: {e}")
+        return False
+
+def test_file_context():
+    """Test that get_file_context slices lines like a split on '\\n'"""
+    try:
+        from src.project_analyzer import ProjectAnalyzer
+        
+        # Form feeds and other separators split lines for str.splitlines() but not here
+        content = ''.join(f"line {n}\x0c tail\n" if n % 4 == 0 else f"line {n}\n" for n in range(1, 21)) + 'last'
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'context.py')
+            with open(path, 'w', encoding='utf-8') as file:
+                file.write(content)
+            
+            analyzer = ProjectAnalyzer({'project': {}})
+            lines = content.split('\n')
+            assert analyzer.get_file_context(path) == content
+            for line_number in (1, 4, 10, 20, 21, 30):
+                for context_lines in (0, 2, 5):
+                    expected = '\n'.join(lines[max(0, line_number - context_lines - 1):line_number + context_lines])
+                    got = analyzer.get_file_context(path, line_number, context_lines)
+                    assert got == expected, f"line {line_number} +/- {context_lines}: {got!r} != {expected!r}"
+        
+        print("✅ File context slicing is correct!")
+        return True
+    except Exception as e:
+        print(f"❌ File context error: {e}")
+        return False
+
+def test_llm_cache():
+    """Test the exact and semantic response caches"""
+    try:
+        from src.llm_cache import LLMCache, SemanticCache, MemoryBackend, FileBackend, cache_key
+        
+        key = cache_key('model', 'prompt', 'system', 0.0)
+        assert key == cache_key('model', 'prompt', 'system', 0.0)
+        assert key != cache_key('model', 'prompt', 'other system', 0.0)
+        
+        cache = LLMCache(MemoryBackend(max_entries=2))
+        cache.set(key, 'response')
+        assert cache.get(key) == 'response'
+        assert cache.get(cache_key('model', 'other', 'system', 0.0)) is None
+        assert cache.stats() == {'hits': 1, 'misses': 1, 'entries': 1}
+        
+        # The least recently used entry is evicted first
+        cache.get(key)
+        cache.set('second', 'b')
+        cache.set('third', 'c')
+        assert cache.get(key) is None and cache.get('third') == 'c'
+        
+        expiring = LLMCache(MemoryBackend(), ttl=1)
+        expiring.backend.set(key, (time.time() - 2, 'stale'))
+        assert expiring.get(key) is None
+        
+        with tempfile.TemporaryDirectory() as directory:
+            LLMCache(FileBackend(directory)).set(key, 'on disk')
+            assert LLMCache(FileBackend(directory)).get(key) == 'on disk'
+        
+        try:
+            import numpy
+        except ImportError:
+            print("Skipping semantic cache checks: numpy is not installed")
+        else:
+            semantic = SemanticCache(threshold=0.9)
+            semantic.set('scope', [1.0, 0.0, 0.0], 'close')
+            assert semantic.get('scope', [0.99, 0.05, 0.0]) == 'close'
+            assert semantic.get('scope', [0.0, 1.0, 0.0]) is None
+            assert semantic.get('other scope', [1.0, 0.0, 0.0]) is None
+        
+        print("✅ Response caches work correctly!")
+        return True
+    except Exception as e:
+        print(f"❌ Response cache error: {e}")
+        return False
+
+def test_program_cache():
+    """Test that program cache patterns are validated and filled in"""
+    try:
+        from src.program_cache import ProgramCache
+        
+        cache = ProgramCache(context_names=('model',))
+        assert cache.add(r'what model is this\??', 'This is {model}.')
+        assert cache.add(r'say (?P<word>\w+)', '{word} {{literally}}')
+        assert not cache.add(r'(unclosed', 'x')
+        assert not cache.add(r'(?P<model>\w+)', 'x')
+        assert not cache.add(r'hello', 'Hi {name}')
+        
+        assert cache.try_match('What model is this?', model='llama3.1') == 'This is llama3.1.'
+        assert cache.try_match('  say größe ') == 'größe {literally}'
+        assert cache.try_match('write a parser') is None
+        assert cache.stats() == {'hits': 2, 'misses': 1, 'entries': 2}
+        
+        print("✅ Program cache works correctly!")
+        return True
+    except Exception as e:
+        print(f"❌ Program cache error: {e}")
+        return False
+
+if __name__ == "__main__":
+    print("Running regression checks...\n")
+    
+    results = {
+        'Analyzer': test_analyzer(),
+        'File context': test_file_context(),
+        'Response caches': test_llm_cache(),
+        'Program cache': test_program_cache(),
+    }
+    
+    print("\nTest results:")
+    for name, ok in results.items():
+        print(f"{name}: {'✅' if ok else '❌'}")
+    
+    if all(results.values()):
+        print("\n✅ All regression checks passed!")
+    else:
+        print("\n❌ Some regression checks failed. Please check the errors above.")
+        sys.exit(1)